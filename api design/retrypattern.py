@@ -1,19 +1,33 @@
-import time
+import asyncio
+import random
 from fastapi import FastAPI ,HTTPException
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+try:
+    import uvloop
+
+    uvloop.install()  # libuv event loop; optional, skipped on Windows
+except ImportError:
+    pass
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Concept:
 # A temporary issue happens (like timeout / network glitch).
 # Retry means: try again a few times before failing.
+# time.sleep would freeze the whole event loop while waiting,
+# so the retry helper is async and awaits asyncio.sleep instead.
 
 class TemporaryError(Exception):
     pass
 
 
-def retry(function, max_retries=3, delay=1):
+async def retry(function, max_retries=3, delay=1):
     """
     Try function again if TemporaryError happens.
+
+    Waits with full jitter (random slice of an exponentially growing window)
+    so many clients retrying at once do not hit the service in lockstep.
     """
     for attempt in range(max_retries + 1):  # first try + retries
         try:
@@ -21,23 +35,29 @@ def retry(function, max_retries=3, delay=1):
         except TemporaryError:
             if attempt == max_retries:
                 raise
-            time.sleep(delay)
+            await asyncio.sleep(random.uniform(0, delay * 2 ** attempt))
 
 
 # This creates the issue:
 # It fails first 2 times, then works.
-call_count = {"count": 0}
+# Each request builds its own service, so there is no shared counter
+# for concurrent requests to race on.
+def make_fake_service(fail_times=2):
+    attempt = 0
+
+    def fake_service():
+        nonlocal attempt
+        attempt += 1
+        if attempt <= fail_times:
+            raise TemporaryError("Temporary failure")
+        return {"message": "Success", "attempt": attempt}
 
-def fake_service():
-    call_count["count"] += 1
-    if call_count["count"] <= 2:
-        raise TemporaryError("Temporary failure")
-    return {"message": "Success", "attempt": call_count["count"]}
+    return fake_service
 
 
 @app.get("/without-retry")
 def without_retry():
-    call_count["count"] = 0
+    fake_service = make_fake_service()
     try:
         return fake_service()  # only 1 try -> usually fails
     except TemporaryError as e:
@@ -45,9 +65,9 @@ def without_retry():
 
 
 @app.get("/with-retry")
-def with_retry():
-    call_count["count"] = 0
+async def with_retry():
+    fake_service = make_fake_service()
     try:
-        return retry(fake_service, max_retries=3, delay=1)  # retries -> succeeds
+        return await retry(fake_service, max_retries=3, delay=1)  # retries -> succeeds
     except TemporaryError as e:
         raise HTTPException(status_code=503, detail=str(e))
\ No newline at end of file
@@ -1,14 +1,50 @@
 import asyncio
 import os
 import random
+import time
+from contextlib import asynccontextmanager, suppress
 from typing import Dict, List
 
-import httpx
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, Response
+import aiohttp
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
-app = FastAPI(title="FastAPI Sidebar + TTS Retry Example")
+try:
+    import uvloop
+
+    # libuv-based event loop: lower per-task overhead for the retry/batching
+    # paths. When deploying with uvicorn, --loop uvloop has the same effect.
+    uvloop.install()
+except ImportError:  # uvloop is optional (not available on Windows)
+    pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One shared session keeps connections alive across /tts calls instead of
+    # paying a fresh TCP+TLS handshake per request.
+    app.state.tts_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=50, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=20),
+    )
+    app.state.tts_queue = asyncio.Queue()
+    worker = asyncio.create_task(_tts_batch_worker(app))
+    try:
+        yield
+    finally:
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+        await app.state.tts_session.close()
+
+
+app = FastAPI(
+    title="FastAPI Sidebar + TTS Retry Example",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 SIDEBAR_MENU: Dict[str, List[str]] = {
     "top": ["Search", "Write", "Notifications"],
@@ -28,67 +64,110 @@ SIDEBAR_MENU: Dict[str, List[str]] = {
     "more": ["More"],
 }
 
+# The menu never changes at runtime, so serialize it once at import instead of
+# re-encoding the dict on every /sidebar request.
+_SIDEBAR_BYTES = orjson.dumps(SIDEBAR_MENU)
+
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
 DEFAULT_ATTEMPTS = 5
 BASE_DELAY_SECONDS = 0.5
 MAX_DELAY_SECONDS = 8.0
+# Capped exponential delays, one per attempt, computed once at import.
+_BACKOFF_DELAYS = [
+    min(MAX_DELAY_SECONDS, BASE_DELAY_SECONDS * (1 << attempt))
+    for attempt in range(DEFAULT_ATTEMPTS)
+]
+_rand = random.random
+# Batching: nearby /tts requests are coalesced so a burst becomes one bounded
+# wave of provider calls instead of N independent retry loops.
+BATCH_MAX = 16
+BATCH_WINDOW_SECONDS = 0.02
+BATCH_CONCURRENCY = 8
 TTS_URL = os.getenv("TTS_URL", "").strip()
 TTS_API_KEY = os.getenv("TTS_API_KEY", "").strip()
+_TTS_CONFIGURED = bool(TTS_URL)
 
 
 class RetryableTTSError(Exception):
     pass
 
 
+class TokenBucket:
+    """Shared retry budget.
+
+    Every retry (not first attempts) must take a token; when the provider is
+    failing broadly the bucket drains and further retries are denied fast,
+    which stops N concurrent requests from amplifying a provider hiccup into
+    a retry storm.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def try_consume(self, amount: float = 1.0) -> bool:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.refill_per_second,
+            )
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return True
+            return False
+
+
+# App-wide budget: at most ~2 retries/second sustained, bursts up to 10.
+_RETRY_BUDGET = TokenBucket(capacity=10.0, refill_per_second=2.0)
+
+
 class TTSRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=4000)
     voice: str = "alloy"
 
 
-async def _call_tts_provider(text: str, voice: str) -> bytes:
-    if not TTS_URL:
-        raise HTTPException(
-            status_code=500,
-            detail="Set TTS_URL environment variable to your TTS provider endpoint.",
-        )
-
+async def _call_tts_provider(session: aiohttp.ClientSession, text: str, voice: str) -> bytes:
     payload = {"text": text, "voice": voice}
     headers = {"Content-Type": "application/json"}
     if TTS_API_KEY:
         headers["Authorization"] = f"Bearer {TTS_API_KEY}"
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.post(TTS_URL, json=payload, headers=headers)
-    except httpx.RequestError as exc:
-        raise RetryableTTSError(str(exc)) from exc
+        async with session.post(TTS_URL, json=payload, headers=headers) as response:
+            if response.status in RETRYABLE_STATUS_CODES:
+                raise RetryableTTSError(f"Retryable HTTP status: {response.status}")
 
-    if response.status_code in RETRYABLE_STATUS_CODES:
-        raise RetryableTTSError(f"Retryable HTTP status: {response.status_code}")
+            if response.status >= 400:
+                detail = (await response.text())[:300]
+                raise HTTPException(status_code=response.status, detail=detail)
 
-    if response.status_code >= 400:
-        raise HTTPException(status_code=response.status_code, detail=response.text[:300])
-
-    return response.content
+            return await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        raise RetryableTTSError(str(exc)) from exc
 
 
-async def _tts_with_backoff(text: str, voice: str) -> bytes:
+async def _tts_with_backoff(session: aiohttp.ClientSession, text: str, voice: str) -> bytes:
     last_error = "unknown error"
 
     for attempt in range(1, DEFAULT_ATTEMPTS + 1):
         try:
-            return await _call_tts_provider(text=text, voice=voice)
+            return await _call_tts_provider(session, text=text, voice=voice)
         except RetryableTTSError as exc:
             last_error = str(exc)
             if attempt == DEFAULT_ATTEMPTS:
                 break
 
-            exponential_delay = min(
-                MAX_DELAY_SECONDS,
-                BASE_DELAY_SECONDS * (2 ** (attempt - 1)),
-            )
+            if not await _RETRY_BUDGET.try_consume():
+                last_error = f"{last_error} (retry budget exhausted)"
+                break
+
             # Full jitter spreads retries to reduce synchronized spikes.
-            sleep_seconds = random.uniform(0, exponential_delay)
+            sleep_seconds = _rand() * _BACKOFF_DELAYS[attempt - 1]
             await asyncio.sleep(sleep_seconds)
 
     raise HTTPException(
@@ -97,6 +176,52 @@ async def _tts_with_backoff(text: str, voice: str) -> bytes:
     )
 
 
+async def _tts_batch_worker(app: FastAPI) -> None:
+    """Drain the TTS queue in small batches and fan results back to waiters.
+
+    Collects up to BATCH_MAX requests or BATCH_WINDOW_SECONDS of arrivals,
+    deduplicates identical (text, voice) payloads so each unique payload hits
+    the provider once, and bounds provider concurrency with a semaphore.
+    """
+    queue: asyncio.Queue = app.state.tts_queue
+    session: aiohttp.ClientSession = app.state.tts_session
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+
+    async def _run_one(text: str, voice: str, futures: list[asyncio.Future]) -> None:
+        async with semaphore:
+            try:
+                audio = await _tts_with_backoff(session, text=text, voice=voice)
+            except Exception as exc:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for future in futures:
+                    if not future.done():
+                        future.set_result(audio)
+
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(batch) < BATCH_MAX:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        grouped: Dict[tuple, list] = {}
+        for data, future in batch:
+            grouped.setdefault((data.text, data.voice), []).append(future)
+
+        await asyncio.gather(
+            *(_run_one(text, voice, futures) for (text, voice), futures in grouped.items())
+        )
+
+
 @app.get("/")
 def read_root():
     return {
@@ -113,18 +238,25 @@ def health():
 
 @app.get("/sidebar")
 def sidebar():
-    return SIDEBAR_MENU
+    return Response(content=_SIDEBAR_BYTES, media_type="application/json")
 
 
 @app.post("/tts")
-async def text_to_speech(data: TTSRequest):
-    audio_bytes = await _tts_with_backoff(text=data.text, voice=data.voice)
+async def text_to_speech(data: TTSRequest, request: Request):
+    # Misconfiguration fails here, before any queueing or retry scaffolding.
+    if not _TTS_CONFIGURED:
+        raise HTTPException(
+            status_code=500,
+            detail="Set TTS_URL environment variable to your TTS provider endpoint.",
+        )
+
+    future = asyncio.get_running_loop().create_future()
+    await request.app.state.tts_queue.put((data, future))
+    audio_bytes = await future
     return Response(content=audio_bytes, media_type="audio/mpeg")
 
 
-@app.get("/demo", response_class=HTMLResponse)
-def demo_page():
-    return """
+DEMO_HTML = """
 <!doctype html>
 <html>
 <head>
@@ -217,3 +349,11 @@ def demo_page():
 </body>
 </html>
 """
+
+# Encoded once at import; the page is a pure constant.
+_DEMO_BYTES = DEMO_HTML.encode()
+
+
+@app.get("/demo", response_class=HTMLResponse)
+def demo_page():
+    return HTMLResponse(content=_DEMO_BYTES)
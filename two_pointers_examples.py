@@ -8,38 +8,125 @@ This file is interview-prep oriented:
 
 from __future__ import annotations
 
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to interpreter paths
+    _HAS_NUMBA = False
+
+try:
+    # Built from _palindrome.pyx with `cythonize -i _palindrome.pyx`.
+    from _palindrome import is_palindrome_c
+
+    _HAS_C_EXT = True
+except ImportError:  # the compiled extension is optional too
+    _HAS_C_EXT = False
+
+
+# Deletion table for str.translate: strips every non-alphanumeric ASCII char
+# in one C-level pass instead of a per-character isalnum() genexpr.
+_DELETE_TBL = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
+
 
 def is_palindrome_bruteforce(s: str) -> bool:
     """Return True if s is a palindrome after filtering non-alphanumeric chars.
 
     Brute-force baseline:
-    - Build a cleaned lowercase string.
+    - Build a cleaned lowercase string (single str.translate scan for ASCII).
     - Compare it with its reverse.
 
     Time: O(n)
     Space: O(n)
     """
-    cleaned = "".join(ch.lower() for ch in s if ch.isalnum())
+    if s.isascii():
+        cleaned = s.lower().translate(_DELETE_TBL)
+    else:
+        cleaned = "".join(ch.lower() for ch in s if ch.isalnum())
     return cleaned == cleaned[::-1]
 
 
-def is_palindrome_two_pointer(s: str) -> bool:
-    """Return True if s is a palindrome using two pointers and O(1) extra space.
+if _HAS_NUMBA:
 
-    Loop invariant:
-    - Before each comparison, every already-checked mirrored pair matches.
-    - left and right always point to the next unchecked candidates from each side.
-    """
+    @njit(cache=True)
+    def _palindrome_kernel(b: np.ndarray) -> bool:
+        """Two-pointer palindrome check over ASCII bytes, compiled to native code.
+
+        For each byte: digits keep their code, letters fold to lowercase via
+        c | 0x20, everything else classifies as 0 and is skipped.
+        """
+        left = 0
+        right = b.shape[0] - 1
+
+        while left < right:
+            # One dedicated skip scan per side: each pointer jumps over its
+            # whole non-alnum run before any comparison is attempted.
+            cl = np.uint8(0)
+            while left < right:
+                c = b[left]
+                f = c | 0x20
+                if 48 <= c <= 57:
+                    cl = c
+                    break
+                if 97 <= f <= 122:
+                    cl = f
+                    break
+                left += 1
+
+            cr = np.uint8(0)
+            while left < right:
+                c = b[right]
+                f = c | 0x20
+                if 48 <= c <= 57:
+                    cr = c
+                    break
+                if 97 <= f <= 122:
+                    cr = f
+                    break
+                right -= 1
+
+            if left >= right:
+                break
+
+            if cl != cr:
+                return False
+
+            left += 1
+            right -= 1
+
+        return True
+
+
+# _ASCII_TBL[c] folds letters to lowercase, keeps digits, and maps everything
+# else to 0, so the hot loop classifies and case-folds with one memory lookup
+# instead of isalnum()/lower() calls.
+_ASCII_TBL = bytes(
+    (c | 0x20) if chr(c).isalpha() else (c if chr(c).isdigit() else 0)
+    for c in range(128)
+)
+
+
+def _is_palindrome_ascii(b: bytes) -> bool:
+    """Two-pointer palindrome check over ASCII bytes using the lookup table."""
     left = 0
-    right = len(s) - 1
+    right = len(b) - 1
 
     while left < right:
-        while left < right and not s[left].isalnum():
+        # Skip each side's whole non-alnum run in one dedicated scan instead
+        # of bouncing through the outer loop per skipped character.
+        while left < right and _ASCII_TBL[b[left]] == 0:
             left += 1
-        while left < right and not s[right].isalnum():
+        while left < right and _ASCII_TBL[b[right]] == 0:
             right -= 1
 
-        if s[left].lower() != s[right].lower():
+        if left >= right:
+            break
+
+        if _ASCII_TBL[b[left]] != _ASCII_TBL[b[right]]:
             return False
 
         left += 1
@@ -48,22 +135,45 @@ def is_palindrome_two_pointer(s: str) -> bool:
     return True
 
 
+def is_palindrome_two_pointer(s: str) -> bool:
+    """Return True if s is a palindrome, two-pointer style on the ASCII fast path.
+
+    ASCII inputs take a byte-level fast path: a numba-compiled kernel when
+    numba is installed, else the Cython extension when it has been built,
+    else a branch-light lookup-table walk. Non-ASCII
+    text is normalized once (alnum filter + per-character lowercase, both
+    driven from C) and compared against its reverse, instead of paying
+    isalnum()/lower() calls per compared character.
+    """
+    try:
+        b = s.encode("ascii")
+    except UnicodeEncodeError:
+        pass
+    else:
+        if _HAS_NUMBA:
+            return bool(_palindrome_kernel(np.frombuffer(b, dtype=np.uint8)))
+        if _HAS_C_EXT:
+            return is_palindrome_c(b)
+        return _is_palindrome_ascii(b)
+
+    cleaned = "".join(map(str.lower, filter(str.isalnum, s)))
+    return cleaned == cleaned[::-1]
+
+
 def _normalize_triplets(triplets: set[tuple[int, int, int]] | list[list[int]]) -> list[list[int]]:
     """Normalize 3Sum output:
     1) each triplet sorted ascending,
     2) no duplicates,
     3) full list sorted lexicographically.
     """
-    normalized_set: set[tuple[int, int, int]] = set()
+    return [list(t) for t in sorted({tuple(sorted(triplet)) for triplet in triplets})]
 
-    if isinstance(triplets, set):
-        for triplet in triplets:
-            normalized_set.add(tuple(sorted(triplet)))
-    else:
-        for triplet in triplets:
-            normalized_set.add(tuple(sorted(triplet)))
 
-    return [list(t) for t in sorted(normalized_set)]
+def _normalize_sorted_tuples(triplets: set[tuple[int, int, int]]) -> list[list[int]]:
+    """Specialized normalization for triplets already stored as sorted tuples:
+    only the lexicographic ordering of the whole set remains to be done.
+    """
+    return [list(t) for t in sorted(triplets)]
 
 
 def three_sum_bruteforce(nums: list[int]) -> list[list[int]]:
@@ -86,65 +196,155 @@ def three_sum_bruteforce(nums: list[int]) -> list[list[int]]:
                 if nums[i] + nums[j] + nums[k] == 0:
                     results.add(tuple(sorted((nums[i], nums[j], nums[k]))))
 
-    return _normalize_triplets(results)
+    return _normalize_sorted_tuples(results)
 
 
-def three_sum_two_pointer(nums: list[int]) -> list[list[int]]:
-    """Return all unique triplets [a, b, c] where a + b + c == 0 using two pointers.
+def _three_sum_searchsorted(arr: np.ndarray) -> np.ndarray:
+    """Vectorized pair search over a sorted int64 array; returns an (m, 3) array.
 
-    Core idea:
-    - Sort array.
-    - Fix index i.
-    - Find pairs in the suffix using left/right pointers.
+    For every middle element j in the suffix after a fixed i, the needed third
+    value is -arr[i] - suffix[j]; one batched np.searchsorted per i looks all
+    of them up at once.
 
-    Loop invariant for each fixed i:
-    - left and right bound the unprocessed search space in nums[i+1:].
-    - If current sum is too small, moving left rightward is the only way to increase it.
-    - If current sum is too large, moving right leftward is the only way to decrease it.
-
-    Time: O(n^2)
-    Space: O(k) for answers (sorting typically in-place for Python list reference).
+    Invariant for each fixed i:
+    - suffix is sorted, so searchsorted(side="right") - 1 gives the last
+      occurrence of each target; a match is valid only when it sits strictly
+      to the right of j (k > j).
+    - Skipping repeated arr[i] and repeated suffix[j] deduplicates triplets.
     """
-    arr = sorted(nums)
-    n = len(arr)
-    results: list[list[int]] = []
+    n = arr.shape[0]
+    blocks: list[np.ndarray] = []
 
     for i in range(n - 2):
         if i > 0 and arr[i] == arr[i - 1]:
             continue
+        # Smallest possible sum at this i is already positive: nothing later
+        # can reach zero either, since arr is sorted.
+        if arr[i] + arr[i + 1] + arr[i + 2] > 0:
+            break
+        # Largest possible sum at this i is still negative: try the next i.
+        if arr[i] + arr[n - 2] + arr[n - 1] < 0:
+            continue
 
-        left = i + 1
-        right = n - 1
-
-        while left < right:
-            total = arr[i] + arr[left] + arr[right]
+        suffix = arr[i + 1 :]
+        targets = -arr[i] - suffix
+        last = np.searchsorted(suffix, targets, side="right") - 1
+
+        valid = last > np.arange(suffix.shape[0])
+        valid &= suffix[np.maximum(last, 0)] == targets
+        # Keep only the first of each repeated middle value to deduplicate.
+        valid[1:] &= suffix[1:] != suffix[:-1]
+
+        js = np.nonzero(valid)[0]
+        if js.size:
+            block = np.empty((js.size, 3), dtype=np.int64)
+            block[:, 0] = arr[i]
+            block[:, 1] = suffix[js]
+            block[:, 2] = targets[js]
+            blocks.append(block)
+
+    if not blocks:
+        return np.empty((0, 3), dtype=np.int64)
+
+    return np.concatenate(blocks)
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _three_sum_kernel(arr: np.ndarray) -> np.ndarray:
+        """Classic two-pointer 3Sum over a sorted int64 array, compiled to native code.
+
+        Returns an (m, 3) array; output grows by doubling so the kernel stays
+        a single pass.
+        """
+        n = arr.shape[0]
+        out = np.empty((16, 3), dtype=np.int64)
+        m = 0
+
+        for i in range(n - 2):
+            if i > 0 and arr[i] == arr[i - 1]:
+                continue
+            # Same bound checks as the searchsorted path: bail out once the
+            # smallest reachable sum is positive, skip while the largest
+            # reachable sum is still negative.
+            if arr[i] + arr[i + 1] + arr[i + 2] > 0:
+                break
+            if arr[i] + arr[n - 2] + arr[n - 1] < 0:
+                continue
+
+            left = i + 1
+            right = n - 1
+
+            while left < right:
+                total = arr[i] + arr[left] + arr[right]
+
+                if total == 0:
+                    if m == out.shape[0]:
+                        bigger = np.empty((out.shape[0] * 2, 3), dtype=np.int64)
+                        bigger[:m] = out
+                        out = bigger
+                    out[m, 0] = arr[i]
+                    out[m, 1] = arr[left]
+                    out[m, 2] = arr[right]
+                    m += 1
 
-            if total == 0:
-                results.append([arr[i], arr[left], arr[right]])
-                left += 1
-                right -= 1
+                    left += 1
+                    right -= 1
 
-                while left < right and arr[left] == arr[left - 1]:
+                    while left < right and arr[left] == arr[left - 1]:
+                        left += 1
+                    while left < right and arr[right] == arr[right + 1]:
+                        right -= 1
+                elif total < 0:
                     left += 1
-                while left < right and arr[right] == arr[right + 1]:
+                else:
                     right -= 1
-            elif total < 0:
-                left += 1
-            else:
-                right -= 1
 
-    return _normalize_triplets(results)
+        return out[:m]
+
+
+def three_sum_two_pointer(nums: list[int]) -> list[list[int]]:
+    """Return all unique triplets [a, b, c] where a + b + c == 0.
+
+    Core idea:
+    - Sort array.
+    - Fix index i.
+    - Find matching pairs in the sorted suffix.
 
+    The pair search runs in a numba-compiled two-pointer kernel when numba is
+    installed, otherwise in the vectorized np.searchsorted path. Both emit
+    triplets already sorted ascending, deduplicated, and in lexicographic
+    order, so no normalization pass is needed.
 
-def _print_test_result(name: str, passed: bool) -> None:
+    Time: O(n^2)
+    Space: O(k) for answers, where k is number of unique triplets.
+    """
+    # np.array already copies nums, so sorting in place skips the second
+    # allocation np.sort would make; quicksort dispatches to optimized C.
+    arr = np.array(nums, dtype=np.int64)
+    arr.sort(kind="quicksort")
+    if arr.shape[0] < 3:
+        return []
+
+    triplets = _three_sum_kernel(arr) if _HAS_NUMBA else _three_sum_searchsorted(arr)
+    return triplets.tolist()
+
+
+def _format_test_result(name: str, passed: bool) -> str:
     status = "PASS" if passed else "FAIL"
-    print(f"[{status}] {name}")
+    return f"[{status}] {name}"
 
 
 def run_demo() -> None:
-    """Run deterministic sample tests and validation checks."""
-    print("=== Two Pointers Demo ===")
-    print()
+    """Run deterministic sample tests and validation checks.
+
+    Output is buffered and written in one shot instead of one print (stdio
+    lock + write syscall) per test line.
+    """
+    lines: list[str] = []
+    lines.append("=== Two Pointers Demo ===")
+    lines.append("")
 
     palindrome_cases: list[tuple[str, bool]] = [
         ("A man, a plan, a canal: Panama", True),
@@ -154,18 +354,20 @@ def run_demo() -> None:
         ("0P", False),
     ]
 
-    print("Palindrome Tests")
+    lines.append("Palindrome Tests")
     for text, expected in palindrome_cases:
         brute = is_palindrome_bruteforce(text)
         optimized = is_palindrome_two_pointer(text)
         consistent = brute == optimized
         correct = optimized == expected
-        _print_test_result(
-            f"input={text!r} expected={expected} brute={brute} optimized={optimized}",
-            consistent and correct,
+        lines.append(
+            _format_test_result(
+                f"input={text!r} expected={expected} brute={brute} optimized={optimized}",
+                consistent and correct,
+            )
         )
 
-    print()
+    lines.append("")
 
     three_sum_cases: list[tuple[list[int], list[list[int]]]] = [
         ([-1, 0, 1, 2, -1, -4], [[-1, -1, 2], [-1, 0, 1]]),
@@ -174,26 +376,30 @@ def run_demo() -> None:
         ([-2, 0, 1, 1, 2], [[-2, 0, 2], [-2, 1, 1]]),
     ]
 
-    print("3Sum Tests")
+    lines.append("3Sum Tests")
     for nums, expected in three_sum_cases:
         brute = three_sum_bruteforce(nums)
         optimized = three_sum_two_pointer(nums)
         dedup_ok = len(optimized) == len({tuple(t) for t in optimized})
         consistent = brute == optimized
         correct = optimized == expected
-        _print_test_result(
-            (
-                f"input={nums} expected={expected} "
-                f"brute={brute} optimized={optimized} dedup_ok={dedup_ok}"
-            ),
-            dedup_ok and consistent and correct,
+        lines.append(
+            _format_test_result(
+                (
+                    f"input={nums} expected={expected} "
+                    f"brute={brute} optimized={optimized} dedup_ok={dedup_ok}"
+                ),
+                dedup_ok and consistent and correct,
+            )
         )
 
-    print()
-    print("Validation checks completed:")
-    print("- brute-force and optimized outputs match after normalization")
-    print("- optimized 3Sum output contains no duplicate triplets")
-    print("- script runs end-to-end with fixed samples (no stdin)")
+    lines.append("")
+    lines.append("Validation checks completed:")
+    lines.append("- brute-force and optimized outputs match after normalization")
+    lines.append("- optimized 3Sum output contains no duplicate triplets")
+    lines.append("- script runs end-to-end with fixed samples (no stdin)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":